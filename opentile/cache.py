@@ -0,0 +1,157 @@
+#    Copyright 2025 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Cache for frames of varying size."""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class _CacheEntry:
+    frame: bytes
+    size: int
+    count: int
+    last_access: int
+
+
+class FrameCache:
+    """Thread safe cache for frames, limited both in number of frames and in
+    total size of the cached frames.
+
+    Frames can differ much in size and in how often they are accessed. Instead
+    of evicting the least recently used frame, the frame with the highest
+    size-adjusted cost (time since last access times size divided by number
+    of accesses, LRU-SP) is evicted. Large frames that are seldom used are
+    thereby evicted before small or frequently used frames, and a single sweep
+    over many frames does not flush out frequently used frames.
+    """
+
+    def __init__(self, max_frames: int, max_bytes: int):
+        """Create a frame cache.
+
+        Parameters
+        ----------
+        max_frames: int
+            Maximum number of frames to cache. Set to 0 to disable caching.
+        max_bytes: int
+            Maximum total size in bytes of cached frames.
+        """
+        self._max_frames = max_frames
+        self._max_bytes = max_bytes
+        self._entries: Dict[Hashable, _CacheEntry] = {}
+        self._size = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of cached frames."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return cached frame for key, or None if frame is not cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of frame to get.
+
+        Returns
+        ----------
+        Optional[bytes]
+            Cached frame or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._clock += 1
+            entry.count += 1
+            entry.last_access = self._clock
+            return entry.frame
+
+    def put(self, key: Hashable, frame: bytes) -> None:
+        """Add frame to cache, evicting other frames if needed. Frames larger
+        than the cache size are not cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of frame to add.
+        frame: bytes
+            Frame to add.
+        """
+        size = len(frame)
+        if self._max_frames <= 0 or size > self._max_bytes:
+            return
+        with self._lock:
+            self._clock += 1
+            existing = self._entries.pop(key, None)
+            if existing is not None:
+                self._size -= existing.size
+            self._entries[key] = _CacheEntry(frame, size, 1, self._clock)
+            self._size += size
+            while len(self._entries) > self._max_frames or self._size > self._max_bytes:
+                self._evict()
+
+    def get_or_create(self, key: Hashable, create: Callable[[], bytes]) -> bytes:
+        """Return cached frame for key, or create and cache frame if not
+        cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key of frame to get.
+        create: Callable[[], bytes]
+            Function creating the frame if not cached.
+
+        Returns
+        ----------
+        bytes
+            Cached or created frame.
+        """
+        frame = self.get(key)
+        if frame is None:
+            frame = create()
+            self.put(key, frame)
+        return frame
+
+    def clear(self) -> None:
+        """Remove all frames from cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _evict(self) -> None:
+        """Evict the frame with highest size-adjusted cost. Lock must be held
+        by caller."""
+        clock = self._clock
+        key = max(
+            self._entries,
+            key=lambda key: (
+                (clock - self._entries[key].last_access + 1)
+                * self._entries[key].size
+                / self._entries[key].count
+            ),
+        )
+        entry = self._entries.pop(key)
+        self._size -= entry.size
@@ -21,16 +21,37 @@ class Settings:
 
     def __init__(self) -> None:
         self._ndpi_frame_cache = 128
+        self._ndpi_frame_cache_bytes = 256 * 1024 * 1024
+        self._use_mmap = False
 
     @property
     def ndpi_frame_cache(self) -> int:
-        """Number of frames to cache for ndpi."""
+        """Number of frames to cache per ndpi file."""
         return self._ndpi_frame_cache
 
     @ndpi_frame_cache.setter
     def ndpi_frame_cache(self, value: int) -> None:
         self._ndpi_frame_cache = value
 
+    @property
+    def ndpi_frame_cache_bytes(self) -> int:
+        """Maximum total size in bytes of frames to cache per ndpi file."""
+        return self._ndpi_frame_cache_bytes
+
+    @ndpi_frame_cache_bytes.setter
+    def ndpi_frame_cache_bytes(self, value: int) -> None:
+        self._ndpi_frame_cache_bytes = value
+
+    @property
+    def use_mmap(self) -> bool:
+        """If to memory map local files when opened instead of reading with
+        positional reads."""
+        return self._use_mmap
+
+    @use_mmap.setter
+    def use_mmap(self, value: bool) -> None:
+        self._use_mmap = value
+
 
 settings = Settings()
 """Global settings variable."""
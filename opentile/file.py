@@ -13,12 +13,17 @@
 #    limitations under the License.
 
 
+import mmap
+import os
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, Optional, Union
 
 from tifffile import TiffFileError, TiffPageSeries, TiffPages, TiffFile
 from upath import UPath
-from fsspec.core import open
+from fsspec.core import OpenFile, open
+from fsspec.implementations.local import LocalFileSystem
+
+from opentile.config import settings
 
 import threading
 from typing import List, Sequence, Tuple
@@ -52,6 +57,8 @@ class OpenTileFile:
             opened_file.close()
             raise Exception(f"Failed to open file {file}") from exception
         self._lock = threading.Lock()
+        self._fileno = self._get_fileno(opened_file)
+        self._mmap = self._get_mmap() if settings.use_mmap else None
 
     @property
     def tiff(self) -> TiffFile:
@@ -88,6 +95,8 @@ class OpenTileFile:
         bytes
             Requested bytes.
         """
+        if self._fileno is not None:
+            return self._read(offset, bytecount)
         with self._lock:
             return self._read(offset, bytecount)
 
@@ -107,14 +116,206 @@ class OpenTileFile:
         List[bytes]
             List of requested bytes.
         """
+        if self._fileno is not None:
+            return self._read_multiple(offsets_bytecounts)
+        with self._lock:
+            return self._read_multiple(offsets_bytecounts)
+
+    def read_multiple_into(
+        self, offsets_bytecounts: Sequence[Tuple[int, int]], buffer: memoryview
+    ) -> None:
+        """Read bytes from multiple locations from file handle into buffer,
+        placing the locations after each other in the requested order. Is
+        thread safe.
+
+        Parameters
+        ----------
+        offsets_bytecounts: Sequence[Tuple[int, int]]
+            List of tuples with offset and lengths to read.
+        buffer: memoryview
+            Writable buffer to read into. Must be at least as large as the
+            sum of the lengths.
+        """
+        if self._fileno is not None:
+            return self._read_multiple_into(offsets_bytecounts, buffer)
         with self._lock:
-            return [
-                self._read(offset, bytecount)
-                for (offset, bytecount) in offsets_bytecounts
-            ]
+            return self._read_multiple_into(offsets_bytecounts, buffer)
+
+    def _read_multiple_into(
+        self, offsets_bytecounts: Sequence[Tuple[int, int]], buffer: memoryview
+    ) -> None:
+        """Read bytes from multiple locations from file handle into buffer.
+        Locations that follow each other in the file are read with a single
+        read. Is not thread safe unless positional reads are used.
+
+        Parameters
+        ----------
+        offsets_bytecounts: Sequence[Tuple[int, int]]
+            List of tuples with offset and lengths to read.
+        buffer: memoryview
+            Writable buffer to read into.
+        """
+        run_offset = 0
+        run_start = 0
+        run_length = 0
+        for offset, bytecount in offsets_bytecounts:
+            if run_length > 0 and offset != run_offset + run_length:
+                self._read_into(run_offset, buffer[run_start : run_start + run_length])
+                run_start += run_length
+                run_length = 0
+            if run_length == 0:
+                run_offset = offset
+            run_length += bytecount
+        if run_length > 0:
+            self._read_into(run_offset, buffer[run_start : run_start + run_length])
+
+    def _read_multiple(
+        self, offsets_bytecounts: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Read bytes from multiple locations from file handle. Locations that
+        are contiguous in the file are read with a single read. Is not thread
+        safe unless positional reads are used.
+
+        Parameters
+        ----------
+        offsets_bytecounts: Sequence[Tuple[int, int]]
+            List of tuples with offset and lengths to read.
+
+        Returns
+        ----------
+        List[bytes]
+            List of requested bytes, in the same order as requested.
+        """
+        data: List[bytes] = [b""] * len(offsets_bytecounts)
+        order = sorted(
+            range(len(offsets_bytecounts)),
+            key=lambda index: offsets_bytecounts[index][0],
+        )
+        run: List[int] = []
+        run_end = 0
+        for index in order:
+            offset, bytecount = offsets_bytecounts[index]
+            if len(run) > 0 and offset != run_end:
+                self._read_run(offsets_bytecounts, run, run_end, data)
+                run = []
+            run.append(index)
+            run_end = offset + bytecount
+        if len(run) > 0:
+            self._read_run(offsets_bytecounts, run, run_end, data)
+        return data
+
+    def _read_run(
+        self,
+        offsets_bytecounts: Sequence[Tuple[int, int]],
+        run: Sequence[int],
+        run_end: int,
+        data: List[bytes],
+    ) -> None:
+        """Read a run of contiguous locations with a single read and split
+        the read bytes into the locations. Is not thread safe unless
+        positional reads are used.
+
+        Parameters
+        ----------
+        offsets_bytecounts: Sequence[Tuple[int, int]]
+            List of tuples with offset and lengths to read.
+        run: Sequence[int]
+            Indices of contiguous locations in offsets_bytecounts, sorted by
+            offset.
+        run_end: int
+            End offset of the last location in the run.
+        data: List[bytes]
+            List to insert read bytes into.
+        """
+        run_start = offsets_bytecounts[run[0]][0]
+        run_data = self._read(run_start, run_end - run_start)
+        if len(run) == 1:
+            data[run[0]] = run_data
+            return
+        for index in run:
+            offset, bytecount = offsets_bytecounts[index]
+            start = offset - run_start
+            data[index] = run_data[start : start + bytecount]
+
+    def _get_fileno(self, opened_file: BinaryIO) -> Optional[int]:
+        """Return file descriptor to use for positional reads, or None if
+        the file is not a plain local file or positional reads are not
+        supported.
+
+        Wrapping files, for example decompressing files, can return the file
+        descriptor of the wrapped file, which does not hold the bytes read by
+        tifffile. Positional reads are therefore only used for uncompressed
+        local files read from the start.
+
+        Parameters
+        ----------
+        opened_file: BinaryIO
+            File opened with fsspec.
+
+        Returns
+        ----------
+        Optional[int]
+            File descriptor of the opened file.
+        """
+        if not hasattr(os, "pread"):
+            return None
+        if (
+            not isinstance(opened_file, OpenFile)
+            or not isinstance(opened_file.fs, LocalFileSystem)
+            or opened_file.compression is not None
+        ):
+            return None
+        try:
+            fileno = self._tiff_file.filehandle.fileno()
+        except OSError:
+            return None
+        if self._tiff_file.filehandle.size != os.fstat(fileno).st_size:
+            # Tiff file does not start at the beginning of the file.
+            return None
+        return fileno
+
+    def _get_mmap(self) -> Optional[mmap.mmap]:
+        """Return read-only memory map of the file, or None if the file is
+        not a local file or could not be memory mapped.
+
+        Returns
+        ----------
+        Optional[mmap.mmap]
+            Memory map of the opened file.
+        """
+        if self._fileno is None:
+            return None
+        try:
+            file_map = mmap.mmap(self._fileno, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if hasattr(mmap, "MADV_RANDOM"):
+            # Frames are read in random order, disable read-ahead.
+            file_map.madvise(mmap.MADV_RANDOM)
+        return file_map
+
+    def _pread(self, offset: int, bytecount: int) -> bytes:
+        """Read bytes from file descriptor without changing the file
+        position. Is thread safe, and does not hold the GIL while reading.
+
+        Parameters
+        ----------
+        offset: int
+            Offset in bytes.
+        bytecount: int
+            Length in bytes.
+
+        Returns
+        ----------
+        bytes
+            Requested bytes.
+        """
+        assert self._fileno is not None
+        return os.pread(self._fileno, bytecount, offset)
 
     def _read(self, offset: int, bytecount: int):
-        """Read bytes from file handle. Is not thread safe.
+        """Read bytes from file handle. Uses memory map or positional reads if
+        supported, otherwise seek and read, which is not thread safe.
 
         Parameters
         ----------
@@ -128,11 +329,44 @@ class OpenTileFile:
         bytes
             Requested bytes.
         """
+        if self._mmap is not None:
+            return self._mmap[offset : offset + bytecount]
+        if self._fileno is not None:
+            return self._pread(offset, bytecount)
         self._tiff_file.filehandle.seek(offset)
         return self._tiff_file.filehandle.read(bytecount)
 
+    def _read_into(self, offset: int, buffer: memoryview) -> None:
+        """Read bytes from file handle into buffer. Uses memory map or
+        positional reads if supported, otherwise seek and read, which is not
+        thread safe.
+
+        Parameters
+        ----------
+        offset: int
+            Offset in bytes.
+        buffer: memoryview
+            Writable buffer to fill.
+        """
+        bytecount = len(buffer)
+        if self._mmap is not None:
+            with memoryview(self._mmap) as file_view:
+                data = file_view[offset : offset + bytecount]
+                buffer[: len(data)] = data
+                data.release()
+        elif self._fileno is not None and hasattr(os, "preadv"):
+            os.preadv(self._fileno, [buffer], offset)
+        elif self._fileno is not None:
+            data = self._pread(offset, bytecount)
+            buffer[: len(data)] = data
+        else:
+            self._tiff_file.filehandle.seek(offset)
+            self._tiff_file.filehandle.readinto(buffer)
+
     def close(self):
         """Close the TiffFile."""
+        if self._mmap is not None:
+            self._mmap.close()
         self._tiff_file.close()
 
     def __enter__(self):
@@ -15,17 +15,18 @@
 """Image implementations for ndpi files."""
 
 from abc import ABCMeta, abstractmethod
-from functools import cached_property, lru_cache
+from functools import cached_property
 from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 from imagecodecs import jpeg8_decode
 from tifffile import COMPRESSION, TiffPage, RESUNIT
 
+from opentile.cache import FrameCache
 from opentile.config import settings
 from opentile.file import OpenTileFile
 from opentile.formats.ndpi.ndpi_tile import NdpiFrameJob, NdpiTile
-from opentile.geometry import Point, Region, Size, SizeMm
+from opentile.geometry import Point, Size, SizeMm
 from opentile.jpeg import Jpeg, JpegCropError
 from opentile.tiler import TiffImage
 
@@ -213,6 +214,7 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
         base_size: Size,
         tile_size: Size,
         jpeg: Jpeg,
+        frame_cache: Optional[FrameCache] = None,
     ):
         """Metaclass for a tiled ndpi image.
 
@@ -228,7 +230,13 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
             Requested tile size.
         jpeg: Jpeg
             Jpeg instance to use.
+        frame_cache: Optional[FrameCache] = None
+            Cache for read frames, that can be shared between images. If None a
+            cache for only this image is created.
         """
+        # Tiled size is read when the base class creates the tiled region, and
+        # must therefore be set before calling super().__init__().
+        self._tiled_size = Size(page.imagewidth, page.imagelength).ceil_div(tile_size)
         super().__init__(page, file, jpeg)
         self._base_size = base_size
         self._tile_size = tile_size
@@ -236,6 +244,11 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
         self._frame_size = Size.max(self.tile_size, self._file_frame_size)
         self._pyramid_index = self._calculate_pyramidal_index(self._base_size)
         self._headers: Dict[Size, bytes] = {}
+        if frame_cache is None:
+            frame_cache = FrameCache(
+                settings.ndpi_frame_cache, settings.ndpi_frame_cache_bytes
+            )
+        self._frame_cache = frame_cache
 
     def __repr__(self) -> str:
         return (
@@ -252,6 +265,11 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
         """The size of the tiles to generate."""
         return self._tile_size
 
+    @property
+    def tiled_size(self) -> Size:
+        """The size of the image when tiled."""
+        return self._tiled_size
+
     @property
     def frame_size(self) -> Size:
         """The default read size used for reading frames."""
@@ -285,7 +303,9 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
         bytes
             Produced tile at position.
         """
-        return next(self.get_tiles([tile_position]))
+        # A single tile is its own frame job, no need to sort into frame jobs.
+        frame_job = NdpiFrameJob(self._create_ndpi_tile(tile_position))
+        return next(iter(self._create_tiles(frame_job).values()))
 
     def get_tiles(self, tile_positions: Sequence[Tuple[int, int]]) -> Iterator[bytes]:
         """Return list of image bytes for tile positions.
@@ -343,8 +363,14 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
         Dict[Point, bytes]:
             Created tiles ordered by tile coordinate.
         """
-
-        frame = self._read_extended_frame(frame_job.position, frame_job.frame_size)
+        position = frame_job.position
+        frame_size = frame_job.frame_size
+        # Key on image and plain ints, hashed without calling Point and Size
+        # __hash__. The image is part of the key as the cache can be shared.
+        frame = self._frame_cache.get_or_create(
+            (self, position.x, position.y, frame_size.width, frame_size.height),
+            lambda: self._read_extended_frame(position, frame_size),
+        )
         tiles = self._crop_to_tiles(frame_job, frame)
         return tiles
 
@@ -391,21 +417,37 @@ class NdpiTiledImage(NdpiImage, metaclass=ABCMeta):
             List of created frame jobs.
 
         """
-        frame_jobs: Dict[Point, NdpiFrameJob] = {}
+        frame_jobs: Dict[Tuple[int, int], NdpiFrameJob] = {}
         for tile_position in tile_positions:
-            tile_point = Point.from_tuple(tile_position)
-            if not self._check_if_tile_inside_image(tile_point):
-                raise ValueError(
-                    f"Tile {tile_point} is outside " f"tiled size {self.tiled_size}"
-                )
-            frame_size = self._get_frame_size_for_tile(tile_point)
-            tile = NdpiTile(tile_point, self.tile_size, frame_size)
-            if tile.frame_position in frame_jobs:
-                frame_jobs[tile.frame_position].append(tile)
+            tile = self._create_ndpi_tile(tile_position)
+            key = (tile.frame_position.x, tile.frame_position.y)
+            frame_job = frame_jobs.get(key)
+            if frame_job is None:
+                frame_jobs[key] = NdpiFrameJob(tile)
             else:
-                frame_jobs[tile.frame_position] = NdpiFrameJob(tile)
+                frame_job.append(tile)
         return list(frame_jobs.values())
 
+    def _create_ndpi_tile(self, tile_position: Tuple[int, int]) -> NdpiTile:
+        """Create ndpi tile for tile position.
+
+        Parameters
+        ----------
+        tile_position: Tuple[int, int]
+            Tile position to create tile for.
+
+        Returns
+        ----------
+        NdpiTile
+            Created tile.
+        """
+        tile_point = Point.from_tuple(tile_position)
+        tiled_size = self._tiled_size
+        if tile_point.x >= tiled_size.width or tile_point.y >= tiled_size.height:
+            raise ValueError(f"Tile {tile_point} is outside tiled size {tiled_size}")
+        frame_size = self._get_frame_size_for_tile(tile_point)
+        return NdpiTile(tile_point, self._tile_size, frame_size)
+
 
 class NdpiOneFrameImage(NdpiTiledImage):
     """Class for a ndpi image containing only one frame that should be tiled.
@@ -434,9 +476,13 @@ class NdpiOneFrameImage(NdpiTiledImage):
         Size
             The read frame size.
         """
+        return self._padded_frame_size
+
+    @cached_property
+    def _padded_frame_size(self) -> Size:
+        """The image size rounded up to the closest tile size."""
         return ((self.frame_size) // self.tile_size + 1) * self.tile_size
 
-    @lru_cache(settings.ndpi_frame_cache)
     def _read_extended_frame(self, position: Point, frame_size: Size) -> bytes:
         """Return padded image covering tile coordinate as valid jpeg bytes.
 
@@ -459,9 +505,10 @@ class NdpiOneFrameImage(NdpiTiledImage):
             self.image_size.width % self.mcu.width != 0
             or self.image_size.height % self.mcu.height != 0
         ):
-            # Extend to whole MCUs
+            # Extend to whole MCUs. Only the header size is changed, so write
+            # it into a single copy of the frame.
             even_size = Size.ceil_div(self.image_size, self.mcu) * self.mcu
-            frame = Jpeg.manipulate_header(frame, even_size)
+            frame = Jpeg.replace_size(frame, Jpeg.size_index(frame), even_size)
         # Use crop_multiple as it allows extending frame
         tile = self._jpeg.crop_multiple(
             frame, [(0, 0, frame_size.width, frame_size.height)]
@@ -482,6 +529,7 @@ class NdpiStripedImage(NdpiTiledImage):
         base_size: Size,
         tile_size: Size,
         jpeg: Jpeg,
+        frame_cache: Optional[FrameCache] = None,
     ):
         """Ndpi image with striped image data.
 
@@ -497,12 +545,26 @@ class NdpiStripedImage(NdpiTiledImage):
             Requested tile size.
         jpeg: Jpeg
             Jpeg instance to use.
+        frame_cache: Optional[FrameCache] = None
+            Cache for read frames, that can be shared between images. If None a
+            cache for only this image is created.
         """
-        super().__init__(page, file, base_size, tile_size, jpeg)
+        super().__init__(page, file, base_size, tile_size, jpeg, frame_cache)
         self._striped_size = Size(self.page.chunked[1], self.page.chunked[0])
         jpeg_header = self.page.jpegheader
         assert isinstance(jpeg_header, bytes)
         self._jpeg_header = jpeg_header
+        self._header_size_index = Jpeg.size_index(jpeg_header)
+        self._stripe_offsets = np.asarray(self.page.dataoffsets, dtype=np.int64)
+        self._stripe_bytecounts = np.asarray(self.page.databytecounts, dtype=np.int64)
+        # Frame size only differs from the default for the last column and row
+        # of tiles, so the edge frame size is calculated once.
+        self._last_tile_position = Point(
+            self.tiled_size.width - 1, self.tiled_size.height - 1
+        )
+        self._edge_frame_size = self._calculate_frame_size_for_tile(
+            self._last_tile_position
+        )
 
     @property
     def stripe_size(self) -> Size:
@@ -560,6 +622,29 @@ class NdpiStripedImage(NdpiTiledImage):
         If tile is an edge tile, ensure that the frame does not extend beyond
         the image limits.
 
+        Parameters
+        ----------
+        tile_position: Point
+            Tile position for frame size calculation.
+
+        Returns
+        ----------
+        Size
+            Frame size to be used at tile position.
+        """
+        if tile_position.x == self._last_tile_position.x:
+            width = self._edge_frame_size.width
+        else:
+            width = self.frame_size.width
+        if tile_position.y == self._last_tile_position.y:
+            height = self._edge_frame_size.height
+        else:
+            height = self.frame_size.height
+        return Size(width, height)
+
+    def _calculate_frame_size_for_tile(self, tile_position: Point) -> Size:
+        """Calculate frame size used for creating tile at tile position.
+
         Parameters
         ----------
         tile_position: Point
@@ -588,7 +673,6 @@ class NdpiStripedImage(NdpiTiledImage):
             height = self.frame_size.height
         return Size(width, height)
 
-    @lru_cache(settings.ndpi_frame_cache)
     def _read_extended_frame(self, position: Point, frame_size: Size) -> bytes:
         """Return extended frame of frame size starting at frame position.
         Returned frame is jpeg bytes including header with correct image size.
@@ -610,21 +694,50 @@ class NdpiStripedImage(NdpiTiledImage):
         if frame_size in self._headers:
             header = self._headers[frame_size]
         else:
-            header = self._jpeg.manipulate_header(self.jpeg_header, frame_size)
+            header = bytes(
+                Jpeg.replace_size(self.jpeg_header, self._header_size_index, frame_size)
+            )
             self._headers[frame_size] = header
 
-        stripe_region = Region(
-            (position * self.tile_size) // self.stripe_size,
-            Size.max(frame_size // self.stripe_size, Size(1, 1)),
-        )
-        indices = [
-            self._get_stripe_position_to_index(stripe_coordinate)
-            for stripe_coordinate in stripe_region.iterate_all()
-        ]
-        frame = self._jpeg.concatenate_fragments(
-            (self._read_frame(index) for index in indices), header
-        )
-        return frame
+        stripe_position = (position * self.tile_size) // self.stripe_size
+        stripe_region_size = Size.max(frame_size // self.stripe_size, Size(1, 1))
+        indices = self._get_stripe_region_indices(stripe_position, stripe_region_size)
+        bytecounts = self._stripe_bytecounts[indices].tolist()
+        # Read the stripes directly into the frame after the header, and
+        # update restart markers in place.
+        frame = bytearray(len(header) + sum(bytecounts) + 2)
+        frame[: len(header)] = header
+        with memoryview(frame) as frame_view:
+            self._file.read_multiple_into(
+                list(zip(self._stripe_offsets[indices].tolist(), bytecounts)),
+                frame_view[len(header) :],
+            )
+        self._jpeg.mark_fragments(frame, len(header), bytecounts)
+        # The frame is shared between threads through the frame cache, return
+        # it as immutable bytes.
+        return bytes(frame)
+
+    def _get_stripe_region_indices(
+        self, position: Point, region_size: Size
+    ) -> np.ndarray:
+        """Return indices of stripes in region, ordered row by row.
+
+        Parameters
+        ----------
+        position: Point
+            Position of upper left stripe in region.
+        region_size: Size
+            Size of region in stripes.
+
+        Returns
+        ----------
+        np.ndarray
+            Stripe indices.
+        """
+        start = self._get_stripe_position_to_index(position)
+        rows = np.arange(region_size.height) * self.striped_size.width
+        columns = np.arange(region_size.width)
+        return (start + rows[:, np.newaxis] + columns).ravel()
 
     def _get_stripe_position_to_index(self, position: Point) -> int:
         """Return stripe index from position.
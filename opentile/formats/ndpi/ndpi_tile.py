@@ -39,17 +39,19 @@ class NdpiTile:
         self._tile_size = tile_size
         self._frame_size = frame_size
 
-        self._tiles_per_frame = Size.max(
-            self._frame_size // self._tile_size, Size(1, 1)
+        # Tiles are created for every requested tile position, use plain
+        # integer arithmetic instead of allocating intermediate Size and Point
+        # objects.
+        tile_width, tile_height = tile_size.width, tile_size.height
+        frame_width, frame_height = frame_size.width, frame_size.height
+        tiles_per_frame_x = max(frame_width // tile_width, 1)
+        tiles_per_frame_y = max(frame_height // tile_height, 1)
+        self._left = (position.x * tile_width) % max(frame_width, tile_width)
+        self._top = (position.y * tile_height) % max(frame_height, tile_height)
+        self._frame_position = Point(
+            (position.x // tiles_per_frame_x) * tiles_per_frame_x,
+            (position.y // tiles_per_frame_y) * tiles_per_frame_y,
         )
-        position_inside_frame: Point = (self.position * self._tile_size) % Size.max(
-            self._frame_size, self._tile_size
-        )
-        self._left = position_inside_frame.x
-        self._top = position_inside_frame.y
-        self._frame_position = (
-            self.position // self._tiles_per_frame
-        ) * self._tiles_per_frame
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, NdpiTile):
@@ -22,6 +22,8 @@ from typing import Any, Dict, Optional, Union
 from tifffile import TiffFile, TiffPage, TiffPageSeries
 from upath import UPath
 
+from opentile.cache import FrameCache
+from opentile.config import settings
 from opentile.file import OpenTileFile
 from opentile.formats.ndpi.ndpi_image import (
     NdpiCroppedImage,
@@ -73,6 +75,9 @@ class NdpiTiler(Tiler):
         if self.tile_size.width % 8 != 0 or self.tile_size.height % 8 != 0:
             raise ValueError(f"Tile size {self.tile_size} not divisible by 8")
         self._jpeg = Jpeg(turbo_path)
+        self._frame_cache = FrameCache(
+            settings.ndpi_frame_cache, settings.ndpi_frame_cache_bytes
+        )
         self._metadata = NdpiMetadata(self.base_page)
         self._label_crop_position = label_crop_position
 
@@ -191,11 +196,21 @@ class NdpiTiler(Tiler):
         assert isinstance(tiff_page, TiffPage)
         if tiff_page.is_tiled:  # Striped ndpi page
             return NdpiStripedImage(
-                tiff_page, self._file, self.base_size, self.tile_size, self._jpeg
+                tiff_page,
+                self._file,
+                self.base_size,
+                self.tile_size,
+                self._jpeg,
+                self._frame_cache,
             )
         # Single frame, force tiling
         return NdpiOneFrameImage(
-            tiff_page, self._file, self.base_size, self.tile_size, self._jpeg
+            tiff_page,
+            self._file,
+            self.base_size,
+            self.tile_size,
+            self._jpeg,
+            self._frame_cache,
         )
 
     @lru_cache(None)
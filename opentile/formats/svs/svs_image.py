@@ -73,7 +73,7 @@ class SvsStripedImage(TiffImage):
         if tile_position != (0, 0):
             raise ValueError("Non-tiled image, expected tile_position (0, 0)")
         indices = range(len(self.page.dataoffsets))
-        scans = (self._read_frame(index) for index in indices)
+        scans = iter(self._read_frames(indices))
         jpeg_tables = self.page.jpegtables
         frame = self._jpeg.concatenate_scans(
             scans, jpeg_tables, self._add_rgb_colorspace_fix
@@ -162,14 +162,18 @@ class SvsLZWImage(TiffImage):
         if tile_position != (0, 0):
             raise ValueError("Non-tiled image, expected tile_position (0, 0)")
 
+        indices = range(len(self.page.dataoffsets))
         tile = np.concatenate(
-            [self._get_row(index) for index in range(len(self.page.dataoffsets))],
+            [
+                self._decode_row(frame, index)
+                for index, frame in zip(indices, self._read_frames(indices))
+            ],
             axis=1,
         )
         return np.squeeze(tile)
 
-    def _get_row(self, index: int) -> np.ndarray:
-        row = self.page.decode(self._read_frame(index), index)[0]
+    def _decode_row(self, frame: bytes, index: int) -> np.ndarray:
+        row = self.page.decode(frame, index)[0]
         assert isinstance(row, np.ndarray)
         return row
 
@@ -256,11 +260,10 @@ class SvsTiledImage(NativeTiledTiffImage):
         bool:
             True if edge contains corrupt tiles.
         """
-        for tile in edge.iterate_all():
-            frame_index = self._tile_point_to_frame_index(tile)
-            if self._page.databytecounts[frame_index] == 0:
-                return True
-        return False
+        positions = edge.positions()
+        frame_indices = positions[:, 1] * self.tiled_size.width + positions[:, 0]
+        bytecounts = np.asarray(self._page.databytecounts)
+        return bool(np.any(bytecounts[frame_indices] == 0))
 
     def _detect_corrupt_edges(self) -> Tuple[bool, bool]:
         """Returns tuple bool indiciting if right and/or bottom edge of page is
@@ -317,8 +320,9 @@ class SvsTiledImage(NativeTiledTiffImage):
         scaled_tile_region = Region(tile_point, Size(1, 1)) * scale
 
         # Get decoded tiles
+        start, end = scaled_tile_region.start, scaled_tile_region.end
         decoded_tiles = self._parent.get_decoded_tiles(
-            [tile.to_tuple() for tile in scaled_tile_region.iterate_all()]
+            [(x, y) for y in range(start.y, end.y) for x in range(start.x, end.x)]
         )
         image_data = np.zeros(
             (self.tile_size * scale).to_tuple() + (3,), dtype=np.uint8
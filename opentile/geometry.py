@@ -18,6 +18,8 @@ import math
 from dataclasses import dataclass
 from typing import Generator, Sequence, Tuple, Union
 
+import numpy as np
+
 
 @dataclass
 class SizeMm:
@@ -105,6 +107,7 @@ class PointMm:
 
 @dataclass
 class Size:
+    __slots__ = ("width", "height")
     width: int
     height: int
 
@@ -207,6 +210,7 @@ class Size:
 
 @dataclass
 class Point:
+    __slots__ = ("x", "y")
     x: int
     y: int
 
@@ -295,6 +299,7 @@ class Point:
 
 @dataclass
 class Region:
+    __slots__ = ("position", "size")
     position: Point
     size: Size
 
@@ -332,6 +337,14 @@ class Region:
             for x in range(self.start.x, self.end.x)
         )
 
+    def positions(self) -> np.ndarray:
+        """Return array of shape (n, 2) with the (x, y) positions in region, in
+        the same order as iterate_all()."""
+        columns, rows = np.meshgrid(
+            np.arange(self.start.x, self.end.x), np.arange(self.start.y, self.end.y)
+        )
+        return np.stack((columns.ravel(), rows.ravel()), axis=-1)
+
     @classmethod
     def from_points(cls, point_1: "Point", point_2: "Point") -> "Region":
         return cls(
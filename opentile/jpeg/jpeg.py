@@ -14,8 +14,9 @@
 
 """Lossless jpeg handling."""
 
+from functools import lru_cache
 from pathlib import Path
-from struct import pack, unpack
+from struct import pack, pack_into, unpack_from
 from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
 from turbojpeg import tjMCUHeight, tjMCUWidth
@@ -25,6 +26,25 @@ from opentile.jpeg.turbojpeg_patch import TurboJPEG_patch as TurboJPEG
 from opentile.jpeg.turbojpeg_patch import find_turbojpeg_path
 
 
+@lru_cache(maxsize=None)
+def _get_turbo_jpeg(turbo_path: Optional[Union[str, Path]]) -> TurboJPEG:
+    """Return TurboJPEG instance for library path. Instances do not keep state
+    between calls and are shared, so that the library is only loaded once per
+    path.
+
+    Parameters
+    ----------
+    turbo_path: Optional[Union[str, Path]]
+        Path to turbojpeg library, or None to use default library.
+
+    Returns
+    ----------
+    TurboJPEG
+        TurboJPEG instance for library path.
+    """
+    return TurboJPEG(turbo_path)
+
+
 class JpegTagNotFound(Exception):
     """Raised when expected Jpeg tag was not found."""
 
@@ -50,11 +70,27 @@ class Jpeg:
         "restart interval": 0xDD,
         "restart mark": 0xD0,
     }
+    # Tags as bytes, including the prefixing tag marker.
+    _TAG_BYTES = {name: bytes([0xFF, tag]) for name, tag in TAGS.items()}
+    # Markers without payload length.
+    _STANDALONE_MARKERS = frozenset([0x01, TAGS["start of image"], *range(0xD0, 0xD8)])
+    # Markers that end the header.
+    _END_OF_HEADER_MARKERS = frozenset([TAGS["start of scan"], TAGS["end of image"]])
+    # Restart markers 0-7 without the prefixing tag (0xFF), indexed by
+    # restart marker index.
+    _RESTART_MARKS = tuple(bytes([0xD0 + index]) for index in range(8))
+    # Restart markers 0-7 including the prefixing tag.
+    _TAGGED_RESTART_MARKS = tuple(bytes([0xFF, 0xD0 + index]) for index in range(8))
+    # Adobe APP14 marker with transform flag 0, indicating that the image is
+    # encoded as RGB (not YCbCr).
+    _ADOBE_RGB_MARKER = (
+        b"\xFF\xEE\x00\x0E\x41\x64\x6F\x62\x65\x00\x64\x80\x00\x00\x00\x00"
+    )
 
     def __init__(self, turbo_path: Optional[Union[str, Path]] = None) -> None:
         if turbo_path is None:
             turbo_path = find_turbojpeg_path()
-        self._turbo_jpeg = TurboJPEG(turbo_path)
+        self._turbo_jpeg = _get_turbo_jpeg(turbo_path)
 
     def get_mcu(self, frame: bytes) -> Size:
         """Return MCU size read from frame header.
@@ -90,16 +126,55 @@ class Jpeg:
         bytes:
             Concatenated frame in bytes.
         """
-        frame = header
+        # Collect the parts and join them once, so that the frame is allocated
+        # and copied once instead of growing for every fragment.
+        parts: List[Union[bytes, memoryview]] = [header]
         for fragment_index, fragment in enumerate(fragments):
             if not (fragment[-2] == Jpeg.TAGS["tag marker"] and fragment[-1] != b"0"):
                 raise JpegTagNotFound(
                     "Tag for end of scan or restart marker not found in scan"
                 )
-            frame += fragment[:-1]  # Do not include restart mark index
-            frame += self.restart_mark(fragment_index)
-        frame += self.end_of_image()
-        return frame
+            restart_mark = self.restart_mark(fragment_index)
+            if fragment[-1] == restart_mark[0]:
+                # Fragment already ends with the correct restart mark.
+                parts.append(fragment)
+                continue
+            # Do not include restart mark index. Slice through a memoryview to
+            # avoid copying the fragment before it is joined.
+            parts.append(memoryview(fragment)[:-1])
+            parts.append(restart_mark)
+        parts.append(self.end_of_image())
+        return b"".join(parts)
+
+    @classmethod
+    def mark_fragments(
+        cls, frame: bytearray, header_length: int, fragment_lengths: Sequence[int]
+    ) -> None:
+        """Update restart markers and append end of image tag in frame made of
+        header followed by vertically concatenated fragments, each ending with
+        a restart marker or end of image tag. The frame must have room for the
+        end of image tag after the last fragment.
+
+        Parameters
+        ----------
+        frame: bytearray
+            Frame with header and fragments to update.
+        header_length: int
+            Length of header in frame.
+        fragment_lengths: Sequence[int]
+            Length of each fragment in frame.
+        """
+        tag_marker = cls.TAGS["tag marker"]
+        restart_mark = cls.TAGS["restart mark"]
+        fragment_end = header_length
+        for fragment_index, fragment_length in enumerate(fragment_lengths):
+            fragment_end += fragment_length
+            if frame[fragment_end - 2] != tag_marker:
+                raise JpegTagNotFound(
+                    "Tag for end of scan or restart marker not found in scan"
+                )
+            frame[fragment_end - 1] = restart_mark + (fragment_index & 7)
+        frame[fragment_end : fragment_end + 2] = cls.end_of_image()
 
     def concatenate_scans(
         self,
@@ -125,44 +200,49 @@ class Jpeg:
         bytes:
             Concatenated frame in bytes.
         """
-        frame = bytearray()
+        # Only the header of the first scan is manipulated, the scan data is
+        # joined into the frame with a single copy.
+        header: Optional[bytearray] = None
+        parts: List[Union[bytes, memoryview]] = []
         image_size: Optional[Size] = None
         scan_size: Optional[Size] = None
         subsample: Optional[int] = None
         for scan_index, scan in enumerate(scans):
             width, height, _subsample, _ = self._turbo_jpeg.decode_header(scan)
+            start_of_scan, length = self._find_tag(scan, self.start_of_scan())
+            if start_of_scan is None or length is None:
+                raise JpegTagNotFound("Start of scan not found in header")
+            scan_start = start_of_scan + length + 2
             if image_size is None:
+                header = bytearray(scan[:scan_start])
                 image_size = Size(width, height)
                 scan_size = Size(width, height)
-                scan_start = 0
                 subsample = _subsample
             else:
                 image_size.height += height
-                start_of_scan, length = self._find_tag(scan, self.start_of_scan())
-                if start_of_scan is None or length is None:
-                    raise JpegTagNotFound("Start of scan not found in header")
-                scan_start = start_of_scan + length + 2
+            parts.append(memoryview(scan)[scan_start:-2])
+            parts.append(self._TAGGED_RESTART_MARKS[scan_index & 7])
 
-            frame += scan[scan_start:-2]
-            frame += b"\xFF" + self.restart_mark(scan_index)
-
-        frame[-2:] = self.end_of_image()
+        assert (
+            header is not None
+            and image_size is not None
+            and scan_size is not None
+            and subsample is not None
+        )
+        parts[-1] = self.end_of_image()
 
         if jpeg_tables is not None:
             if rgb_colorspace_fix:
-                frame = self._add_jpeg_tables_and_rgb_color_space_fix(
-                    frame, jpeg_tables
+                header = self._add_jpeg_tables_and_rgb_color_space_fix(
+                    header, jpeg_tables
                 )
             else:
-                frame = self._add_jpeg_tables(frame, jpeg_tables)
+                header = self._add_jpeg_tables(header, jpeg_tables)
 
-        assert (
-            image_size is not None and scan_size is not None and subsample is not None
+        header = self._manipulate_header(
+            header, image_size, scan_size.area // self.subsample_to_mcu_size(subsample)
         )
-        frame = self._manipulate_header(
-            frame, image_size, scan_size.area // self.subsample_to_mcu_size(subsample)
-        )
-        return bytes(frame)
+        return b"".join([header, *parts])
 
     def fill_frame(self, frame: bytes, luminance: float) -> bytes:
         """Return frame filled with color from luminance.
@@ -233,13 +313,18 @@ class Jpeg:
 
         """
 
+        # Build the frame in a single join instead of inserting into a
+        # bytearray copy, avoiding a memmove of the scan data and two copies.
+        start_of_scan = frame.find(cls.start_of_scan())
+        frame_view = memoryview(frame)
+        parts: List[Union[bytes, memoryview]] = [
+            frame_view[:start_of_scan],
+            memoryview(jpeg_tables)[2:-2],
+        ]
         if apply_rgb_colorspace_fix:
-            frame = cls._add_jpeg_tables_and_rgb_color_space_fix(
-                bytearray(frame), jpeg_tables
-            )
-        else:
-            frame = cls._add_jpeg_tables(bytearray(frame), jpeg_tables)
-        return bytes(frame)
+            parts.append(cls._ADOBE_RGB_MARKER)
+        parts.append(frame_view[start_of_scan:])
+        return b"".join(parts)
 
     @classmethod
     def manipulate_header(
@@ -270,30 +355,74 @@ class Jpeg:
             cls._manipulate_header(bytearray(frame), image_size, restart_interval)
         )
 
+    @classmethod
+    def size_index(cls, header: bytes) -> int:
+        """Return index of the pixel size (height, width) in the start of
+        frame segment of header.
+
+        Parameters
+        ----------
+        header: bytes
+            Header to search.
+
+        Returns
+        ----------
+        int:
+            Index of the pixel size in header.
+        """
+        start_of_frame_index, _ = cls._find_tag(header, cls.start_of_frame())
+        if start_of_frame_index is None:
+            raise JpegTagNotFound("Start of frame tag not found in header")
+        return start_of_frame_index + 5
+
+    @classmethod
+    def replace_size(cls, header: bytes, size_index: int, size: Size) -> bytearray:
+        """Return copy of header with pixel size replaced. Use with a size
+        index from `size_index()` to avoid searching the header for each new
+        size.
+
+        Parameters
+        ----------
+        header: bytes
+            Header to replace pixel size in.
+        size_index: int
+            Index of the pixel size in header.
+        size: Size
+            Pixel size to insert into header.
+
+        Returns
+        ----------
+        bytearray:
+            Header with replaced pixel size.
+        """
+        updated_header = bytearray(header)
+        pack_into(">HH", updated_header, size_index, size.height, size.width)
+        return updated_header
+
     @classmethod
     def start_of_frame(cls) -> bytes:
         """Return bytes representing a start of frame tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["start of frame"]])
+        return cls._TAG_BYTES["start of frame"]
 
     @classmethod
     def start_of_scan(cls) -> bytes:
         """Return bytes representing a start of scan tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["start of scan"]])
+        return cls._TAG_BYTES["start of scan"]
 
     @classmethod
     def end_of_image(cls) -> bytes:
         """Return bytes representing a end of image tag."""
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["end of image"]])
+        return cls._TAG_BYTES["end of image"]
 
     @classmethod
     def restart_mark(cls, index: int) -> bytes:
         """Return bytes representing a restart marker of index (0-7), without
         the prefixing tag (0xFF)."""
-        return bytes([cls.TAGS["restart mark"] + index % 8])
+        return cls._RESTART_MARKS[index & 7]
 
     @classmethod
     def restart_interval(cls) -> bytes:
-        return bytes([cls.TAGS["tag marker"], cls.TAGS["restart interval"]])
+        return cls._TAG_BYTES["restart interval"]
 
     @staticmethod
     def code_short(value: int) -> bytes:
@@ -303,11 +432,61 @@ class Jpeg:
     def subsample_to_mcu_size(subsample: int) -> int:
         return tjMCUWidth[subsample] * tjMCUHeight[subsample]
 
-    @staticmethod
+    @classmethod
     def _find_tag(
-        frame: Union[bytes, bytearray], tag: bytes
+        cls, frame: Union[bytes, bytearray], tag: bytes
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Return first index and length of payload of tag in header. Only the
+        header (up to and including the start of scan tag) is searched, so that
+        a missing tag does not result in a search through the scan data. The
+        header is searched by following the segment lengths, so that tag bytes
+        in segment payloads (e.g. tables) are not matched.
+
+        Parameters
+        ----------
+        frame: bytes
+            Frame with header to search.
+        tag: bytes
+            Tag to search for.
+
+        Returns
+        ----------
+        Tuple[Optional[int], Optional[int]]:
+            Position of tag in header and length of payload.
+        """
+        tag_marker = cls.TAGS["tag marker"]
+        index = 0
+        frame_length = len(frame)
+        while index + 1 < frame_length:
+            if frame[index] != tag_marker:
+                # Not a valid segment structure, fall back to searching.
+                return cls._search_tag(frame, tag)
+            marker = frame[index + 1]
+            if marker == tag_marker:
+                # Fill byte
+                index += 1
+                continue
+            if index + 4 > frame_length:
+                break
+            if marker == tag[1]:
+                (length,) = unpack_from(">H", frame, index + 2)
+                return index, length
+            if marker in cls._END_OF_HEADER_MARKERS:
+                break
+            if marker in cls._STANDALONE_MARKERS:
+                index += 2
+                continue
+            (length,) = unpack_from(">H", frame, index + 2)
+            index += 2 + length
+        return None, None
+
+    @classmethod
+    def _search_tag(
+        cls, frame: Union[bytes, bytearray], tag: bytes
     ) -> Tuple[Optional[int], Optional[int]]:
-        """Return first index and length of payload of tag in header.
+        """Return first index and length of payload of tag in header, found
+        by searching the header (up to and including the start of scan tag)
+        for the tag bytes.
 
         Parameters
         ----------
@@ -321,9 +500,14 @@ class Jpeg:
         Tuple[Optional[int], Optional[int]]:
             Position of tag in header and length of payload.
         """
-        index = frame.find(tag)
+        start_of_scan_index = frame.find(cls.start_of_scan())
+        if start_of_scan_index == -1:
+            header_end = len(frame)
+        else:
+            header_end = start_of_scan_index + 2
+        index = frame.find(tag, 0, header_end)
         if index != -1:
-            (length,) = unpack(">H", frame[index + 2 : index + 4])
+            (length,) = unpack_from(">H", frame, index + 2)
             return index, length
 
         return None, None
@@ -353,12 +537,7 @@ class Jpeg:
             Manipulated header.
         """
         if size is not None:
-            start_of_frame_index, _ = cls._find_tag(frame, cls.start_of_frame())
-            if start_of_frame_index is None:
-                raise JpegTagNotFound("Start of frame tag not found in header")
-            size_index = start_of_frame_index + 5
-            frame[size_index : size_index + 2] = cls.code_short(size.height)
-            frame[size_index + 2 : size_index + 4] = cls.code_short(size.width)
+            pack_into(">HH", frame, cls.size_index(frame), size.height, size.width)
 
         if restart_interval is not None:
             restart_payload = cls.code_short(restart_interval)
@@ -397,9 +576,5 @@ class Jpeg:
         """Add jpeg tables to frame and add Adobe APP14 marker with transform
         flag 0 indicating image is encoded as RGB (not YCbCr)."""
         start_of_scan = frame.find(cls.start_of_scan())
-        frame[start_of_scan:start_of_scan] = (
-            jpegtables[2:-2]
-            + b"\xFF\xEE\x00\x0E\x41\x64\x6F\x62"
-            + b"\x65\x00\x64\x80\x00\x00\x00\x00"
-        )
+        frame[start_of_scan:start_of_scan] = jpegtables[2:-2] + cls._ADOBE_RGB_MARKER
         return frame
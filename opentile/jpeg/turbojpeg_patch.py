@@ -165,10 +165,13 @@ class BlankImage:
             subsampling = background_data.subsample
         coeffs = cls.get_np_coeffs(coeffs_ptr, array_region)
         coeffs[:][:][:] = 0
-
-        for x in range(0, array_region.w // tjMCUWidth[subsampling]):
-            for y in range(0, array_region.h // tjMCUHeight[subsampling]):
-                coeffs[y][x][0] = dc_component
+        # Set the dc coefficient of the blocks with a single slice assignment
+        # instead of looping over the blocks in python.
+        coeffs[
+            : array_region.h // tjMCUHeight[subsampling],
+            : array_region.w // tjMCUWidth[subsampling],
+            0,
+        ] = dc_component
 
         return 1
 
@@ -257,8 +257,11 @@ class TiffImage(metaclass=ABCMeta):
         """
         if raw:
             return (self._read_frame(index) for index in range(self.tiled_size.area))
+        tiled_size = self.tiled_size
         return (
-            self.get_tile(tile.to_tuple()) for tile in self.tiled_region.iterate_all()
+            self.get_tile((x, y))
+            for y in range(tiled_size.height)
+            for x in range(tiled_size.width)
         )
 
     def get_all_tiles_decoded(self) -> Iterator[np.ndarray]:
@@ -269,9 +272,11 @@ class TiffImage(metaclass=ABCMeta):
         Iterator[np.ndarray]
             Iterator of all tiles in image decoded.
         """
+        tiled_size = self.tiled_size
         return (
-            self.get_decoded_tile(tile.to_tuple())
-            for tile in self.tiled_region.iterate_all()
+            self.get_decoded_tile((x, y))
+            for y in range(tiled_size.height)
+            for x in range(tiled_size.width)
         )
 
     def close(self) -> None:
@@ -315,11 +320,10 @@ class TiffImage(metaclass=ABCMeta):
         )
 
     def _read_frames(self, indices: Sequence[int]) -> List[bytes]:
+        dataoffsets = self._page.dataoffsets
+        databytecounts = self._page.databytecounts
         return self._file.read_multiple(
-            [
-                (self._page.dataoffsets[index], self._page.databytecounts[index])
-                for index in indices
-            ]
+            [(dataoffsets[index], databytecounts[index]) for index in indices]
         )
 
     def _check_if_tile_inside_image(self, tile_position: Point) -> bool:
@@ -366,10 +370,9 @@ class NativeTiledTiffImage(TiffImage, metaclass=ABCMeta):
         tile_point = Point.from_tuple(tile_position)
         frame_index = self._tile_point_to_frame_index(tile_point)
         tile = self._read_frame(frame_index)
-        if self.page.jpegtables is not None:
-            tile = Jpeg.add_jpeg_tables(
-                tile, self.page.jpegtables, self._add_rgb_colorspace_fix
-            )
+        jpeg_tables = self._page.jpegtables
+        if jpeg_tables is not None:
+            tile = Jpeg.add_jpeg_tables(tile, jpeg_tables, self._add_rgb_colorspace_fix)
         return tile
 
     def get_tiles(self, tile_positions: Sequence[Tuple[int, int]]) -> Iterator[bytes]:
@@ -385,18 +388,16 @@ class NativeTiledTiffImage(TiffImage, metaclass=ABCMeta):
         Iterator[bytes]
             Produced tiles at positions.
         """
-        tile_points = [
-            Point.from_tuple(tile_position) for tile_position in tile_positions
-        ]
-        frame_indices = [
-            self._tile_point_to_frame_index(tile_point) for tile_point in tile_points
-        ]
+        # Look up tiled width, tables, and colorspace fix once instead of for
+        # every tile.
+        tiled_width = self.tiled_size.width
+        frame_indices = [y * tiled_width + x for x, y in tile_positions]
         tiles = self._read_frames(frame_indices)
-        if self.page.jpegtables is not None:
+        jpeg_tables = self._page.jpegtables
+        if jpeg_tables is not None:
+            add_rgb_colorspace_fix = self._add_rgb_colorspace_fix
             return (
-                Jpeg.add_jpeg_tables(
-                    tile, self.page.jpegtables, self._add_rgb_colorspace_fix
-                )
+                Jpeg.add_jpeg_tables(tile, jpeg_tables, add_rgb_colorspace_fix)
                 for tile in tiles
             )
         return iter(tiles)
@@ -0,0 +1,108 @@
+#    Copyright 2025 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import pytest
+
+from opentile.cache import FrameCache
+
+
+@pytest.mark.unittest
+class TestFrameCache:
+    def test_get_or_create(self):
+        # Arrange
+        cache = FrameCache(2, 100)
+        created = []
+
+        def create() -> bytes:
+            created.append(1)
+            return b"frame"
+
+        # Act
+        first = cache.get_or_create("key", create)
+        second = cache.get_or_create("key", create)
+
+        # Assert
+        assert first == second == b"frame"
+        assert len(created) == 1
+
+    def test_max_frames(self):
+        # Arrange
+        cache = FrameCache(2, 100)
+
+        # Act
+        for key in range(3):
+            cache.put(key, b"frame")
+
+        # Assert
+        assert len(cache) == 2
+        assert 0 not in cache
+
+    def test_max_bytes(self):
+        # Arrange
+        cache = FrameCache(10, 10)
+
+        # Act
+        cache.put(0, bytes(6))
+        cache.put(1, bytes(6))
+
+        # Assert
+        assert len(cache) == 1
+        assert cache.size == 6
+
+    def test_too_large_frame_not_cached(self):
+        # Arrange
+        cache = FrameCache(10, 10)
+
+        # Act
+        cache.put(0, bytes(11))
+
+        # Assert
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        # Arrange
+        cache = FrameCache(0, 10)
+
+        # Act
+        cache.put(0, bytes(1))
+
+        # Assert
+        assert len(cache) == 0
+
+    def test_frequently_used_frame_not_evicted_by_sweep(self):
+        # Arrange
+        cache = FrameCache(3, 100)
+        cache.put("hot", bytes(10))
+        for _ in range(10):
+            cache.get("hot")
+
+        # Act
+        for key in range(5):
+            cache.put(key, bytes(10))
+
+        # Assert
+        assert "hot" in cache
+
+    def test_large_frame_evicted_before_small(self):
+        # Arrange
+        cache = FrameCache(2, 100)
+        cache.put("large", bytes(50))
+        cache.put("small", bytes(5))
+
+        # Act
+        cache.put("new", bytes(5))
+
+        # Assert
+        assert "large" not in cache
+        assert "small" in cache
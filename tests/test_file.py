@@ -0,0 +1,166 @@
+#    Copyright 2025 SECTRA AB
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import gzip
+from pathlib import Path
+from typing import Sequence, Tuple
+
+import numpy as np
+import pytest
+from tifffile import imwrite
+
+from opentile.config import settings
+from opentile.file import OpenTileFile
+
+
+@pytest.fixture()
+def file_path(tmp_path: Path):
+    file_path = tmp_path.joinpath("test.tiff")
+    imwrite(file_path, np.arange(64 * 64, dtype=np.uint16).reshape(64, 64))
+    yield file_path
+
+
+@pytest.fixture()
+def file(file_path: Path):
+    with OpenTileFile(file_path) as file:
+        yield file
+
+
+@pytest.fixture()
+def gzip_file_path(file_path: Path):
+    gzip_file_path = file_path.with_suffix(".tiff.gz")
+    gzip_file_path.write_bytes(gzip.compress(file_path.read_bytes()))
+    yield gzip_file_path
+
+
+@pytest.fixture()
+def mmap_file(file_path: Path):
+    settings.use_mmap = True
+    try:
+        with OpenTileFile(file_path) as file:
+            yield file
+    finally:
+        settings.use_mmap = False
+
+
+@pytest.mark.unittest
+class TestOpenTileFile:
+    def test_read(self, file: OpenTileFile, file_path: Path):
+        # Arrange
+        expected = file_path.read_bytes()[100:150]
+
+        # Act
+        data = file.read(100, 50)
+
+        # Assert
+        assert data == expected
+
+    @pytest.mark.parametrize(
+        "offsets_bytecounts",
+        [
+            [(100, 50), (150, 25), (175, 10)],
+            [(175, 10), (100, 50), (150, 25)],
+            [(100, 50), (200, 25), (150, 50)],
+            [(100, 50), (100, 50), (120, 10)],
+            [(100, 0), (100, 50)],
+        ],
+    )
+    def test_read_multiple(
+        self,
+        file: OpenTileFile,
+        file_path: Path,
+        offsets_bytecounts: Sequence[Tuple[int, int]],
+    ):
+        # Arrange
+        content = file_path.read_bytes()
+        expected = [
+            content[offset : offset + bytecount]
+            for offset, bytecount in offsets_bytecounts
+        ]
+
+        # Act
+        data = file.read_multiple(offsets_bytecounts)
+
+        # Assert
+        assert data == expected
+
+    def test_read_multiple_into(self, file: OpenTileFile, file_path: Path):
+        # Arrange
+        content = file_path.read_bytes()
+        offsets_bytecounts = [(100, 50), (150, 25), (300, 10), (120, 5)]
+        expected = b"".join(
+            content[offset : offset + bytecount]
+            for offset, bytecount in offsets_bytecounts
+        )
+        buffer = bytearray(len(expected))
+
+        # Act
+        file.read_multiple_into(offsets_bytecounts, memoryview(buffer))
+
+        # Assert
+        assert buffer == expected
+
+    def test_read_without_positional_reads(self, file: OpenTileFile, file_path: Path):
+        # Arrange
+        file._fileno = None
+        expected = file_path.read_bytes()[100:150]
+
+        # Act
+        data = file.read(100, 50)
+
+        # Assert
+        assert data == expected
+
+    def test_read_with_mmap(self, mmap_file: OpenTileFile, file_path: Path):
+        # Arrange
+        content = file_path.read_bytes()
+        offsets_bytecounts = [(150, 25), (100, 50), (300, 10)]
+        expected = [
+            content[offset : offset + bytecount]
+            for offset, bytecount in offsets_bytecounts
+        ]
+
+        # Act
+        data = mmap_file.read_multiple(offsets_bytecounts)
+
+        # Assert
+        assert mmap_file._mmap is not None
+        assert data == expected
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_read_compressed_file(
+        self, file_path: Path, gzip_file_path: Path, use_mmap: bool
+    ):
+        # Arrange
+        content = file_path.read_bytes()
+        offsets_bytecounts = [(100, 50), (150, 25), (300, 10)]
+        expected = [
+            content[offset : offset + bytecount]
+            for offset, bytecount in offsets_bytecounts
+        ]
+        buffer = bytearray(sum(bytecount for _, bytecount in offsets_bytecounts))
+        settings.use_mmap = use_mmap
+        try:
+            with OpenTileFile(gzip_file_path, {"compression": "gzip"}) as file:
+                # Act
+                data = file.read_multiple(offsets_bytecounts)
+                file.read_multiple_into(offsets_bytecounts, memoryview(buffer))
+
+                # Assert
+                assert file._fileno is None
+                assert file._mmap is None
+        finally:
+            settings.use_mmap = False
+        assert data == expected
+        assert buffer == b"".join(expected)
@@ -91,6 +91,23 @@ class TestJpeg:
         assert index == 621
         assert length == 17
 
+    def test_find_tag_only_searches_header(self):
+        # Arrange
+        frame = (
+            bytes([0xFF, 0xD8])
+            + Jpeg.start_of_scan()
+            + Jpeg.code_short(2)
+            + Jpeg.restart_interval()
+            + Jpeg.code_short(4)
+        )
+
+        # Act
+        index, length = Jpeg._find_tag(frame, Jpeg.restart_interval())
+
+        # Assert
+        assert index is None
+        assert length is None
+
     def test_update_header(self, ndpi_header: bytes):
         # Arrange
         target_size = Size(512, 200)
@@ -105,6 +122,42 @@ class TestJpeg:
         )
         assert target_size == Size(stripe_width, stripe_height)
 
+    def test_find_tag_skips_segment_payloads(self):
+        # Arrange
+        table = (
+            bytes([0xFF, 0xDB]) + Jpeg.code_short(6) + Jpeg.start_of_frame() + bytes(2)
+        )
+        start_of_frame = Jpeg.start_of_frame() + Jpeg.code_short(17) + bytes(15)
+        frame = bytes([0xFF, 0xD8]) + table + start_of_frame + Jpeg.start_of_scan()
+
+        # Act
+        index, length = Jpeg._find_tag(frame, Jpeg.start_of_frame())
+
+        # Assert
+        assert index == 2 + len(table)
+        assert length == 17
+
+    def test_replace_size(self):
+        # Arrange
+        header = (
+            bytes([0xFF, 0xD8])
+            + Jpeg.start_of_frame()
+            + Jpeg.code_short(17)
+            + bytes([0x08])
+            + Jpeg.code_short(8)
+            + Jpeg.code_short(8)
+            + bytes(12)
+            + Jpeg.start_of_scan()
+        )
+        target_size = Size(512, 200)
+        size_index = Jpeg.size_index(header)
+
+        # Act
+        updated_header = Jpeg.replace_size(header, size_index, target_size)
+
+        # Assert
+        assert updated_header == Jpeg.manipulate_header(header, target_size)
+
     def test_concatenate_fragments(
         self, ndpi_tiff: TiffFile, ndpi_level: TiffPage, ndpi_header: bytes
     ):
@@ -120,6 +173,22 @@ class TestJpeg:
         # Assert
         assert md5(frame).hexdigest() == "ea40e78b081c42a6aabf8da81f976f11"
 
+    def test_mark_fragments(self):
+        # Arrange
+        header = bytes([0xFF, 0xD8])
+        fragments = [bytes([0x01, 0xFF, 0xD5]), bytes([0x02, 0x03, 0xFF, 0xD9])]
+        frame = bytearray(header + b"".join(fragments) + bytes(2))
+
+        # Act
+        Jpeg.mark_fragments(
+            frame, len(header), [len(fragment) for fragment in fragments]
+        )
+
+        # Assert
+        assert frame == bytes(
+            [0xFF, 0xD8, 0x01, 0xFF, 0xD0, 0x02, 0x03, 0xFF, 0xD1, 0xFF, 0xD9]
+        )
+
     def test_concatenate_scans(self, svs_tiff: TiffFile, svs_overview: TiffPage):
         # Arrange
         jpeg = Jpeg()
@@ -135,6 +204,16 @@ class TestJpeg:
         )
         assert md5(frame).hexdigest() == "fdde19f6d10994c5b866b43027ff94ed"
 
+    def test_turbo_jpeg_shared(self):
+        # Arrange
+
+        # Act
+        first = Jpeg()
+        second = Jpeg()
+
+        # Assert
+        assert first._turbo_jpeg is second._turbo_jpeg
+
     def test_code_short(self):
         # Arrange
         jpeg = Jpeg()
@@ -194,6 +194,22 @@ class TestNdpiTiler:
 
         assert tiles == tiles_single
 
+    @pytest.mark.parametrize("tile_size", [Size(2048, 2048)])
+    def test_get_tile_covering_frame(self, level: NdpiStripedImage, tile_size: Size):
+        # Arrange
+        frame_size = level._get_frame_size_for_tile(Point(0, 0))
+        frame = level._read_extended_frame(Point(0, 0), frame_size)
+        expected = level._jpeg.crop_multiple(
+            frame, [(0, 0, frame_size.width, frame_size.height)]
+        )[0]
+
+        # Act
+        tile = level.get_tile((0, 0))
+
+        # Assert
+        assert frame_size == tile_size
+        assert tile == expected
+
     def test_map_tile_to_frame(self, level: NdpiStripedImage, tile_size: Size):
         # Arrange
 
@@ -354,6 +370,20 @@ class TestNdpiTiler:
         # Assert
         assert tiled_size == Size(100, 75)
 
+    def test_frame_cache_shared_between_levels(
+        self, level: NdpiStripedImage, one_frame_level: NdpiOneFrameImage
+    ):
+        # Arrange
+        level.get_tile((0, 0))
+        one_frame_level.get_tile((0, 0))
+
+        # Act
+        frame_cache = level._frame_cache
+
+        # Assert
+        assert frame_cache is one_frame_level._frame_cache
+        assert len(frame_cache) == 2
+
     def test_get_smallest_stripe_width(self, tiler: NdpiTiler):
         # Arrange
 